@@ -12,6 +12,7 @@ class Config:
     # LLM
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    MAX_CONCURRENT_LLM = int(os.getenv("MAX_CONCURRENT_LLM", "8"))
 
     # Slack
     SLACK_CLIENT_ID = os.getenv("SLACK_CLIENT_ID")
@@ -36,6 +37,7 @@ class Config:
 
     # Monitoring
     LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY")
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 
 # Export singleton
 config = Config()
@@ -0,0 +1,32 @@
+import logging
+import logging.handlers
+import queue
+
+# Third-party loggers capped at WARNING regardless of LOG_LEVEL
+QUIET_LOGGERS = ("httpx", "httpcore", "httpx2")
+
+
+def setup_logging(level: str = "INFO") -> logging.handlers.QueueListener:
+    """
+    Route every root-logger record through a queue so the blocking stream write
+    happens on the listener's thread, not on the event loop.
+    Returns the started listener; call .stop() on shutdown to flush it.
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+    # httpx logs every request URL at INFO; Slack response_urls are bearer
+    # capabilities and the per-request lines are noise, so keep those quiet
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -5,11 +5,15 @@ from langgraph.graph.message import add_messages
 from typing import Dict, Any, List, Annotated, Optional
 from pydantic import BaseModel
 
+def merge_metadata(current: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Reducer for State.metadata: nodes return only the keys they changed"""
+    return {**current, **update}
+
 class State(BaseModel):
     messages: Annotated[list, add_messages]
     workflow_type: Optional[str] = None
     user_id: Optional[str] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Annotated[Dict[str, Any], merge_metadata] = {}
 
 class SlackEventRequest(BaseModel):
     token: str
@@ -1,12 +1,20 @@
-import json
 import os
+import orjson
+import httpx
+import logging
 from datetime import datetime
 from typing import Dict, Any, List
 
 from config.env_config import config as env
-from agents import Agent, Runner, OpenAIChatCompletionsModel
+from agents import Agent, Runner, OpenAIChatCompletionsModel, set_default_openai_client
 from agents.mcp import MCPServerStdio
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+log = logging.getLogger(__name__)
+
+# Longest specialist answer used verbatim as its own summary
+SUMMARY_MAX_CHARS = 120
+_SUMMARY_PREFIX = f"ONE LINE summary (max {SUMMARY_MAX_CHARS} chars):\n"
 
 class AgentsManager:
     """Direct specialist agents with MCP tools using OpenAI"""
@@ -45,7 +53,17 @@ class AgentsManager:
         if self._initialized:
             return
         
-        print("Initializing MCP servers...")
+        # One pooled HTTP/2 client for every agent run, so concurrent workflows
+        # multiplex over a warm connection instead of each paying for TCP/TLS setup
+        set_default_openai_client(AsyncOpenAI(
+            api_key=env.OPENAI_API_KEY,
+            http_client=DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=50),
+            ),
+        ))
+        
+        log.info("Initializing MCP servers...")
         
         # Get absolute paths to MCP server files
         db_server_path = os.path.abspath(
@@ -91,11 +109,11 @@ class AgentsManager:
         self.mcp_servers = [db_server, kb_server]
         self._mcp_server_contexts = [db_server, kb_server]
         
-        print(f"✓ Connected to {len(self.mcp_servers)} MCP servers")
+        log.info("✓ Connected to %d MCP servers", len(self.mcp_servers))
         
         await self._setup_agents()
         self._initialized = True
-        print("Agents ready!")
+        log.info("Agents ready!")
     
     async def _setup_agents(self):
         """Setup specialist agents with MCP tools"""
@@ -237,22 +255,15 @@ Be extremely concise.""",
         )
     
     async def _run_agent(self, agent: Agent, input_message: str) -> str:
-        """Run agent with OpenAI using Runner"""
-        try:
-            # Use Runner.run to execute the agent
-            result = await Runner.run(
-                starting_agent=agent,
-                input=input_message
-            )
-            
-            # Return the final output from the agent
-            return result.final_output
-            
-        except Exception as e:
-            print(f"Error running agent {agent.name}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return f"Error: {str(e)}"
+        """Run agent with OpenAI using Runner; failures propagate to the caller"""
+        # Use Runner.run to execute the agent
+        result = await Runner.run(
+            starting_agent=agent,
+            input=input_message
+        )
+        
+        # Return the final output from the agent
+        return result.final_output
     
     async def process_workflow(self, workflow_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process workflow with direct specialist"""
@@ -272,13 +283,10 @@ Be extremely concise.""",
             
             specialist = specialists.get(workflow_type, self.qa_agent)
             
-            print(f"\n{'='*60}")
-            print(f"Workflow: {workflow_type} | User: {data.get('user_id', 'unknown')}")
-            print(f"{'='*60}")
-            print(f"→ {specialist.name} handling request")
+            log.info("Workflow: %s | User: %s → %s", workflow_type, data.get("user_id", "unknown"), specialist.name)
             
             # Build user query message
-            user_query = data.get("command_text", "") or json.dumps(data, indent=2)
+            user_query = data.get("command_text", "") or orjson.dumps(data, default=str).decode()
             
             task_msg = f"""User query: {user_query}
 
@@ -289,11 +297,20 @@ Process this request using your MCP tools and provide a direct answer."""
             # Run the specialist agent
             response = await self._run_agent(specialist, task_msg)
             
-            print(f"Response from Specialist => {response}")
+            log.debug("Response from Specialist => %s", response)
             
-            # Generate summary using summarizer agent
-            summary_msg = f"ONE LINE summary (max 120 chars):\n{response}"
-            summary = await self._run_agent(self.summarizer_agent, summary_msg)
+            # Generate summary using summarizer agent, unless the answer already
+            # fits in one summary line
+            stripped = response.strip()
+            if len(stripped) <= SUMMARY_MAX_CHARS and "\n" not in stripped:
+                summary = stripped
+            else:
+                try:
+                    summary = await self._run_agent(self.summarizer_agent, _SUMMARY_PREFIX + response)
+                except Exception as e:
+                    # The answer itself is fine; fall back to its first line
+                    log.warning("Summarizer failed, using truncated answer: %s", e)
+                    summary = stripped.split("\n", 1)[0][:SUMMARY_MAX_CHARS]
             
             # Store conversation history
             conversation_id = f"{workflow_type}_{datetime.now().timestamp()}"
@@ -317,9 +334,7 @@ Process this request using your MCP tools and provide a direct answer."""
             }
             
         except Exception as e:
-            print(f"Error processing workflow: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error processing workflow: %s", e)
             
             return {
                 "status": "error",
@@ -330,13 +345,13 @@ Process this request using your MCP tools and provide a direct answer."""
     
     async def cleanup(self):
         """Cleanup MCP server connections"""
-        print("Cleaning up MCP servers...")
+        log.info("Cleaning up MCP servers...")
         for server in self._mcp_server_contexts:
             try:
                 await server.__aexit__(None, None, None)
             except Exception as e:
-                print(f"Error closing server: {e}")
-        print("✓ MCP servers closed")
+                log.error("Error closing server: %s", e)
+        log.info("✓ MCP servers closed")
 
 
 # Singleton instance
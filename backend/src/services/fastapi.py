@@ -5,40 +5,103 @@
 import json
 import os
 import hmac
-import hashlib
 import httpx
+import orjson
 import time
 import asyncio
 import logging
 import urllib.parse
 from typing import Dict, Any, Optional
-from pydantic import BaseModel
 from datetime import datetime
 from contextlib import asynccontextmanager
 from config.slack_client import slack_client
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from services.workflow_graph import workflow_graph
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from config.pydantic_models import SlackEventRequest, SlackCommandRequest, StandupRequest, MeetingRequest, QARequest, OnboardingRequest, TaskUpdate
 from config.env_config import config as env
+from config.logging_config import setup_logging
 
 SLACK_SIGNING_SECRET = env.SLACK_SIGNING_SECRET
 
+# Bounded pool for slash-command workflows so bursts can't pile up unbounded work;
+# the worker count is also the cap on concurrent agent (LLM + MCP) runs
+WORKFLOW_QUEUE_SIZE = 1024
+WORKFLOW_WORKERS = env.MAX_CONCURRENT_LLM
+
+# Outbound Slack posts per workspace: ~1 msg/sec with a small burst
+SLACK_POST_RATE = 1.0
+SLACK_POST_BURST = 3
+SLACK_MAX_RETRY_AFTER = 30.0
+
+# Replay window for X-Slack-Request-Timestamp, compared in integer nanoseconds
+SLACK_REPLAY_WINDOW_NS = 5 * 60 * 1_000_000_000
+# Slack requests are far smaller than this; bound the bytes we'll hash
+SLACK_MAX_BODY_BYTES = 1 << 20
+# Above this size the HMAC runs in a worker thread (OpenSSL releases the GIL)
+SLACK_HASH_OFFLOAD_BYTES = 4096
+# Encoded once; the signature check runs on every webhook. None when unset, so
+# Slack routes fail closed instead of accepting an empty-key HMAC.
+_SIGNING_KEY = SLACK_SIGNING_SECRET.encode("utf-8") if SLACK_SIGNING_SECRET else None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("🚀 Starting AI Workplace Assistant...")
-    print("✅ AutoGen agents initialized")
-    print("✅ LangGraph workflow ready")
+    log_listener = setup_logging(env.LOG_LEVEL)
+    log.info("🚀 Starting AI Workplace Assistant...")
+    if _SIGNING_KEY is None:
+        log.error("SLACK_SIGNING_SECRET is not set; all Slack requests will be rejected")
+    # Start MCP servers and agents now so the first slash command doesn't pay for it
+    try:
+        await workflow_graph.initialize()
+        log.info("✅ AutoGen agents initialized")
+        log.info("✅ LangGraph workflow ready")
+    except Exception:
+        log.exception("Workflow warmup failed; it will be retried on the first request")
+    # One pooled HTTP/2 client for every outbound Slack post
+    app.state.slack_http = httpx.AsyncClient(
+        timeout=10.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+    )
+    app.state.workflow_queue = asyncio.Queue(maxsize=WORKFLOW_QUEUE_SIZE)
+    workers = [
+        asyncio.create_task(workflow_worker(app.state.workflow_queue))
+        for _ in range(WORKFLOW_WORKERS)
+    ]
+    background = [*workers, asyncio.create_task(refresh_clock())]
     yield
     # Shutdown
-    print("👋 Shutting down AI Workplace Assistant...")
+    log.info("👋 Shutting down AI Workplace Assistant...")
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    # Workers only await shielded graph runs; stop those before MCP teardown
+    await workflow_graph.cancel_inflight()
+    await app.state.slack_http.aclose()
+    if workflow_graph.agents_manager is not None:
+        await workflow_graph.agents_manager.cleanup()
+    log_listener.stop()
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson; default response class for the app.
+    Kept local because fastapi.responses.ORJSONResponse is deprecated in current
+    FastAPI and warns on every first response.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 app = FastAPI(
     title="AI Workplace Assistant",
     description="Slack/Discord bot with AutoGen multi-agent orchestration",
     version="1.0.0",
+    default_response_class=OrjsonResponse,
     lifespan=lifespan
 )
 
@@ -56,31 +119,106 @@ app.add_middleware(
 security = HTTPBearer()
 log = logging.getLogger("slack-webhook")
 
+class TokenBucket:
+    """Async token bucket: refills `rate` tokens per second up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+_slack_buckets: Dict[str, TokenBucket] = {}
+
+def get_slack_bucket(response_url: str) -> TokenBucket:
+    """Bucket per workspace; response_url paths look like /commands/<team_id>/..."""
+    parts = urllib.parse.urlsplit(response_url).path.split("/")
+    key = parts[2] if len(parts) > 2 and parts[2] else response_url
+    bucket = _slack_buckets.get(key)
+    if bucket is None:
+        bucket = _slack_buckets[key] = TokenBucket(SLACK_POST_RATE, SLACK_POST_BURST)
+    return bucket
+
+def get_retry_after(response: httpx.Response) -> float:
+    try:
+        delay = float(response.headers.get("Retry-After", "1"))
+    except ValueError:
+        delay = 1.0
+    return min(max(delay, 0.0), SLACK_MAX_RETRY_AFTER)
+
 async def post_to_slack_response_url(response_url: str, payload: Dict[str, Any]):
     """
     Post JSON payload to Slack response_url and log result.
-    Payload should include "text" and optionally "blocks".
+    Payload should include "response_type", "text" and optionally "blocks";
+    it is sent as-is.
     """
-    # Ensure response_type in payload so message is visible to channel
-    payload_to_send = dict(payload)  # shallow copy
-    # Prefer final to be in_channel unless caller wants ephemeral
-    if "response_type" not in payload_to_send:
-        payload_to_send["response_type"] = "in_channel"
-
-    log.info("Posting result to Slack response_url...")
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            r = await client.post(response_url, json=payload_to_send)
-            log.info("Slack POST status: %s, body: %s", r.status_code, r.text)
+    log.debug("Posting result to Slack response_url...")
+    content = orjson.dumps(payload)
+    await get_slack_bucket(response_url).acquire()
+    client: httpx.AsyncClient = app.state.slack_http
+    try:
+        r = await client.post(
+            response_url,
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+        if r.status_code == 429:
+            # Slack drops messages posted too fast; honour Retry-After once
+            delay = get_retry_after(r)
+            log.warning("Slack rate limited response_url, retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+            r = await client.post(
+                response_url,
+                content=content,
+                headers={"Content-Type": "application/json"},
+            )
+        if r.status_code >= 400:
+            # Only failures are worth reading the body for; success is just "ok"
+            log.error("Slack POST failed %s: %s", r.status_code, r.text)
             r.raise_for_status()
-        except httpx.HTTPError as e:
-            log.exception("Failed to post to Slack response_url: %s", e)
-            # optionally: fallback to Slack Web API using BOT token if you have it
-            # or save result to DB for retry
-            return False
+        log.debug("Slack POST ok %s", r.status_code)
+    except httpx.HTTPError as e:
+        log.exception("Failed to post to Slack response_url: %s", e)
+        # optionally: fallback to Slack Web API using BOT token if you have it
+        # or save result to DB for retry
+        return False
     return True
 
 
+# Slash command -> workflow type understood by workflow_graph
+COMMAND_WORKFLOWS = {
+    "/standup": "standup",
+    "/onboard": "onboarding",
+    "/ask": "qa",
+    "/meeting": "meeting",
+    "/transcribe": "transcription",
+}
+
+# Per-command message templates; anything not listed falls back to _UNKNOWN_COMMAND_TEMPLATE
+_COMMAND_TEMPLATES = {
+    "/standup": "📌 *Standup Summary* for *{user_name}*\n{summary}",
+    "/onboard": "🚀 Onboarding update for *{user_name}*\n{summary}",
+    "/ask": "💡 Question from *{user_name}*:\n> {text}\n\n{summary}",
+    "/meeting": "📅 Meeting Summary:\n{summary}",
+    "/transcribe": "📝 Transcript:\n{summary}",
+}
+_UNKNOWN_COMMAND_TEMPLATE = "⚠️ Unknown command: `{command}` by *{user_name}* ({user_id})"
+# "text" is only the notification fallback when blocks are present; keep it short
+SLACK_FALLBACK_TEXT_LIMIT = 3000
+
+
 def format_slack_response(
     command: str,
     user_name: str,
@@ -101,21 +239,14 @@ def format_slack_response(
         summary_text = workflow_result.get("full_result", "No summary available.")
 
     # --- Format based on command ---
-    if command == "/standup":
-        body = f"📌 *Standup Summary* for *{user_name}*\n{summary_text}"
-    elif command == "/onboard":
-        body = f"🚀 Onboarding update for *{user_name}*\n{summary_text}"
-    elif command == "/ask":
-        body = (
-            f"💡 Question from *{user_name}*:\n> {text}\n\n"
-            f"{summary_text}"
-        )
-    elif command == "/meeting":
-        body = f"📅 Meeting Summary:\n{summary_text}"
-    elif command == "/transcribe":
-        body = f"📝 Transcript:\n{summary_text}"
-    else:
-        body = f"⚠️ Unknown command: `{command}` by *{user_name}* ({user_id})"
+    template = _COMMAND_TEMPLATES.get(command, _UNKNOWN_COMMAND_TEMPLATE)
+    body = template.format(
+        command=command,
+        user_name=user_name,
+        user_id=user_id,
+        text=text,
+        summary=summary_text,
+    )
 
     # --- Footer (context info) ---
     conv_id = workflow_result.get("conversation_id")
@@ -134,7 +265,8 @@ def format_slack_response(
             "elements": [{"type": "mrkdwn", "text": " • ".join(footer_parts)}]
         })
 
-    return {"text": body, "blocks": blocks}
+    # Final results are visible to the whole channel
+    return {"response_type": "in_channel", "text": body[:SLACK_FALLBACK_TEXT_LIMIT], "blocks": blocks}
 
 # ---------- workflow runner ---------- 
 
@@ -146,25 +278,31 @@ async def run_workflow_and_post_result(command: str, text: str, user_name: str,
     try:
         log.info("Running workflow for %s / %s", command, user_id)
 
-        # map slash command to workflow type (remove leading '/')
-        workflow_type = command.lstrip("/")
+        # map slash command to workflow type
+        workflow_type = COMMAND_WORKFLOWS.get(command)
 
         # call your langgraph workflow (adjust call if different)
         try:
-            workflow_result = await workflow_graph.execute_workflow(
-                workflow_type,
-                {"command_text": text, "user_id": user_id},
-                user_id
-            )
+            if workflow_type is None:
+                # nothing to run; the formatter reports the unknown command
+                workflow_result = {}
+            else:
+                workflow_result = await workflow_graph.execute_workflow(
+                    workflow_type,
+                    {"command_text": text, "user_id": user_id},
+                    user_id
+                )
         except Exception as e:
             log.exception("Workflow execution failed: %s", e)
             workflow_result = {"metadata": {"error": str(e)}}
 
-        print("Workflow result: ", workflow_result)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Workflow result: %s", orjson.dumps(workflow_result, default=str).decode())
 
         # Build slack payload using the formatter
         slack_payload = format_slack_response(command, user_name, user_id, text, workflow_result)
-        log.info("Posting formatted payload to slack: %s", slack_payload)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Posting formatted payload to slack: %s", slack_payload)
 
         # Post to response_url and log status
         success = await post_to_slack_response_url(response_url, slack_payload)
@@ -173,8 +311,8 @@ async def run_workflow_and_post_result(command: str, text: str, user_name: str,
 
     except asyncio.CancelledError:
         log.warning("Background workflow task cancelled (shutdown).")
-        # do not re-raise
-        return
+        # re-raise so the owning worker actually stops
+        raise
     except Exception:
         log.exception("Unhandled error in run_workflow_and_post_result")
         # optionally post an error to Slack using response_url
@@ -186,20 +324,44 @@ async def run_workflow_and_post_result(command: str, text: str, user_name: str,
         except Exception:
             pass
 
-class SlackChallenge(BaseModel):
-    token: str
-    challenge: str
-    type: str
+async def workflow_worker(queue: asyncio.Queue):
+    """
+    Long-lived consumer started in lifespan; runs queued slash commands one at a time.
+    """
+    while True:
+        job = await queue.get()
+        try:
+            await run_workflow_and_post_result(*job)
+        finally:
+            queue.task_done()
+
+def check_slack_signature(body: bytes, timestamp: str, slack_signature: str):
+    """Pure-CPU part of the Slack check: HMAC the basestring and compare."""
+    # Compare raw 32-byte digests instead of hex strings
+    if not slack_signature.startswith("v0="):
+        raise HTTPException(status_code=400, detail="Invalid Slack signature")
+    try:
+        expected = bytes.fromhex(slack_signature[3:])
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Slack signature")
+
+    if _SIGNING_KEY is None:
+        raise HTTPException(status_code=500, detail="Slack signing secret not configured")
 
-# Helper to cache body so multiple reads don't consume
-async def get_cached_body(request: Request) -> bytes:
-    if not hasattr(request, "_cached_body"):
-        request._cached_body = await request.body()
-    return request._cached_body
+    sig_basestring = b"v0:" + timestamp.encode("utf-8") + b":" + body
+    # hmac.digest is the one-shot OpenSSL path, no HMAC object per request
+    my_digest = hmac.digest(_SIGNING_KEY, sig_basestring, "sha256")
 
-def verify_slack_request(request: Request, body: bytes):
-    timestamp = request.headers.get("X-Slack-Request-Timestamp")
-    slack_signature = request.headers.get("X-Slack-Signature")
+    if not hmac.compare_digest(my_digest, expected):
+        raise HTTPException(status_code=400, detail="Invalid Slack signature")
+
+def check_slack_headers(headers: Headers) -> tuple[str, str]:
+    """
+    Header presence and replay-window check. Needs no body, so it runs
+    before the body is read; returns (timestamp, signature).
+    """
+    timestamp = headers.get("X-Slack-Request-Timestamp")
+    slack_signature = headers.get("X-Slack-Signature")
 
     if not timestamp or not slack_signature:
         raise HTTPException(status_code=400, detail="Missing Slack headers")
@@ -210,18 +372,88 @@ def verify_slack_request(request: Request, body: bytes):
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid timestamp")
 
-    if abs(time.time() - req_ts) > 60 * 5:
+    if abs(time.time_ns() - req_ts * 1_000_000_000) > SLACK_REPLAY_WINDOW_NS:
         raise HTTPException(status_code=400, detail="Request too old")
 
-    sig_basestring = f"v0:{timestamp}:{body.decode('utf-8')}".encode("utf-8")
-    my_signature = "v0=" + hmac.new(
-        SLACK_SIGNING_SECRET.encode("utf-8"),
-        sig_basestring,
-        hashlib.sha256
-    ).hexdigest()
+    return timestamp, slack_signature
 
-    if not hmac.compare_digest(my_signature, slack_signature):
-        raise HTTPException(status_code=400, detail="Invalid Slack signature")
+async def verify_slack_body(body: bytes, timestamp: str, slack_signature: str):
+    # Cheap checks first: HMAC cost grows with body size
+    if len(body) > SLACK_MAX_BODY_BYTES:
+        raise HTTPException(status_code=400, detail="Request body too large")
+
+    # Keep the event loop free while hashing large (Events API) payloads
+    if len(body) > SLACK_HASH_OFFLOAD_BYTES:
+        await asyncio.to_thread(check_slack_signature, body, timestamp, slack_signature)
+    else:
+        check_slack_signature(body, timestamp, slack_signature)
+
+async def reject_slack_request(scope: Scope, receive: Receive, send: Send, error: HTTPException):
+    response = JSONResponse({"detail": error.detail}, status_code=error.status_code)
+    await response(scope, receive, send)
+
+class SlackVerifyMiddleware:
+    """
+    Pure ASGI middleware guarding Slack-origin routes.
+    Checks headers and the replay window before reading the body, then buffers
+    the body, verifies the signature and replays the bytes downstream, so bad
+    or replayed requests are rejected before routing and validation.
+    """
+
+    def __init__(self, app: ASGIApp, paths: frozenset):
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            timestamp, slack_signature = check_slack_headers(Headers(scope=scope))
+        except HTTPException as e:
+            await reject_slack_request(scope, receive, send, e)
+            return
+
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > SLACK_MAX_BODY_BYTES:
+                await reject_slack_request(
+                    scope, receive, send,
+                    HTTPException(status_code=400, detail="Request body too large"),
+                )
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        try:
+            await verify_slack_body(body, timestamp, slack_signature)
+        except HTTPException as e:
+            await reject_slack_request(scope, receive, send, e)
+            return
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+
+# Every route Slack calls must carry a valid signature
+SLACK_SIGNED_PATHS = frozenset({"/slack/events", "/webhook/slack/commands"})
+app.add_middleware(SlackVerifyMiddleware, paths=SLACK_SIGNED_PATHS)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Simple JWT validation (implement your own logic)"""
@@ -233,46 +465,96 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 # WEBHOOK ENDPOINTS
 # ============================================================================
 
+# Static parts of the responses below, built once at import.
+# The root body is pre-encoded; only the timestamp is spliced in per request.
+_ROOT_JSON_PREFIX = orjson.dumps({
+    "message": "AI Workplace Assistant is running!",
+    "status": "healthy",
+    "endpoints": {
+        "slack_commands": "/webhook/slack/commands",
+        "slack_events": "/webhook/slack/events",
+        "health": "/api/health",
+        "qa": "/api/qa/query"
+    }
+})[:-1] + b',"timestamp":"'
+_ROOT_JSON_SUFFIX = b'"}'
+
+# Wall-clock timestamp for status responses, refreshed once a second by
+# refresh_clock (started in lifespan) instead of formatted per request
+_now_iso = datetime.now().isoformat().encode()
+
+async def refresh_clock():
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat().encode()
+        await asyncio.sleep(1)
+
+# The only slash-command form fields we read; everything else is skipped undecoded
+_SLACK_COMMAND_FIELDS = frozenset((b"command", b"text", b"user_id", b"user_name", b"response_url"))
+
+def parse_slack_command_form(body: bytes) -> Dict[str, str]:
+    """Single pass over the urlencoded body, percent-decoding only the fields we use."""
+    form = {}
+    for part in body.split(b"&"):
+        key, sep, value = part.partition(b"=")
+        if sep and key in _SLACK_COMMAND_FIELDS:
+            form[key.decode("ascii")] = urllib.parse.unquote_plus(value.decode("utf-8", "replace"))
+    return form
+
+def build_ack(command: str) -> dict:
+    return {"response_type": "ephemeral", "text": f"⏳ Working on {command}... I'll post the result here shortly."}
+
+_ACK_BY_COMMAND = {command: build_ack(command) for command in _COMMAND_TEMPLATES}
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "AI Workplace Assistant is running!",
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "endpoints": {
-            "slack_commands": "/webhook/slack/commands",
-            "slack_events": "/webhook/slack/events", 
-            "health": "/api/health",
-            "qa": "/api/qa/query"
-        }
-    } 
+    return Response(
+        content=_ROOT_JSON_PREFIX + _now_iso + _ROOT_JSON_SUFFIX,
+        media_type="application/json",
+    )
 
 @app.post("/slack/events")
-async def slack_events(challenge_data: SlackChallenge):
-    return {"challenge": challenge_data.challenge}
+async def slack_events(request: Request):
+    # Signature already checked by SlackVerifyMiddleware.
+    # Events are pass-through, so parse the raw body once instead of building a model.
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid event payload")
+
+    if payload.get("type") == "url_verification":
+        return {"challenge": payload.get("challenge", "")}
+
+    log.debug("Slack event received: %s", payload.get("type"))
+    return {"ok": True}
 
 
 @app.post("/webhook/slack/commands")
-async def slack_commands(request: Request, background_tasks: BackgroundTasks):
-    # 1) get body once and verify
-    body = await get_cached_body(request)
-    verify_slack_request(request, body)
+async def slack_commands(request: Request):
+    # 1) body is already verified by SlackVerifyMiddleware
+    body = await request.body()
 
     # 2) parse form data
-    form = urllib.parse.parse_qs(body.decode("utf-8"))
-    command = form.get("command", [""])[0]
-    text = form.get("text", [""])[0]
-    user_id = form.get("user_id", [""])[0]
-    user_name = form.get("user_name", [""])[0]
-    response_url = form.get("response_url", [""])[0]
+    form = parse_slack_command_form(body)
+    command = form.get("command", "")
+    text = form.get("text", "")
+    user_id = form.get("user_id", "")
+    user_name = form.get("user_name", "")
+    response_url = form.get("response_url", "")
 
     log.info("Slash command received: %s by %s", command, user_name)
 
     # 3) immediate ack (must return within 3s)
-    ack = {"response_type": "ephemeral", "text": f"⏳ Working on {command}... I'll post the result here shortly."}
+    ack = _ACK_BY_COMMAND.get(command) or build_ack(command)
 
-    # 4) schedule background job
-    background_tasks.add_task(run_workflow_and_post_result, command, text, user_name, user_id, response_url)
+    # 4) hand off to the workflow workers
+    try:
+        request.app.state.workflow_queue.put_nowait((command, text, user_name, user_id, response_url))
+    except asyncio.QueueFull:
+        log.warning("Workflow queue full, rejecting %s from %s", command, user_name)
+        return {"response_type": "ephemeral", "text": "⚠️ I'm handling a lot of requests right now. Please try again in a minute."}
 
     return ack
\ No newline at end of file
@@ -1,9 +1,10 @@
 # ============================================================================
 # MCP TOOL MANAGER AND GEMINI CLIENT
 # ============================================================================
-import json
 import os
+import orjson
 import asyncio
+import logging
 from typing import Dict, Any, Optional, List, Callable
 
 # MCP (Model Context Protocol)
@@ -12,6 +13,8 @@ from mcp.client.stdio import stdio_client
  
 from config.env_config import config as env
 
+log = logging.getLogger(__name__)
+
 class MCPToolManager:
     """Manages MCP servers and converts them to callable Python functions for OpenAI Agents SDK"""
     
@@ -19,6 +22,7 @@ class MCPToolManager:
         self.sessions: Dict[str, ClientSession] = {}
         self.available_tools: Dict[str, Any] = {}
         self.tool_functions: Dict[str, Callable] = {}
+        self._tools_by_server: Dict[str, List[Callable]] = {}  # built once at connect time
         self.connection_errors: Dict[str, str] = {}
         self._session_contexts = {}  # Store context managers to keep sessions alive
     
@@ -70,6 +74,7 @@ class MCPToolManager:
                 
                 # Get available tools
                 tools_response = await session.list_tools()
+                server_tools = self._tools_by_server.setdefault(name, [])
                 
                 for tool in tools_response.tools:
                     tool_key = f"{name}_{tool.name}"
@@ -86,12 +91,13 @@ class MCPToolManager:
                     
                     # Store function with metadata in OpenAI format
                     self.tool_functions[tool_key] = fn
+                    server_tools.append(fn)
                 
-                print(f"✓ Connected to MCP server: {name} ({len(tools_response.tools)} tools)")
+                log.info("✓ Connected to MCP server: %s (%d tools)", name, len(tools_response.tools))
                 
             except Exception as e:
                 error_msg = f"Failed to connect to MCP server {name}: {str(e)}"
-                print(f"✗ {error_msg}")
+                log.error("✗ %s", error_msg)
                 self.connection_errors[name] = str(e)
     
     def _create_tool_function(self, server_name: str, tool_name: str, description: str, input_schema: dict) -> Callable:
@@ -113,27 +119,31 @@ class MCPToolManager:
                 
                 # Extract content from MCP result
                 if hasattr(result, 'content') and result.content:
-                    # Parse text content from MCP response
-                    content_text = ""
+                    # Parse text content from MCP response (join once, not +=)
+                    parts = []
                     for content_item in result.content:
                         if hasattr(content_item, 'text'):
-                            content_text += content_item.text
+                            parts.append(content_item.text)
                         elif hasattr(content_item, 'type') and content_item.type == 'text':
-                            content_text += str(content_item)
+                            parts.append(str(content_item))
+                    content_text = "".join(parts)
                     
-                    # Try to parse as JSON if possible
-                    try:
-                        parsed_data = json.loads(content_text)
-                        return parsed_data
-                    except json.JSONDecodeError:
-                        # Return as is if not JSON
-                        return {"result": content_text}
+                    # Try to parse as JSON if it can be an object/array; plain
+                    # text skips the parser and the exception unwind entirely
+                    stripped = content_text.lstrip()
+                    if stripped[:1] in ("{", "["):
+                        try:
+                            return orjson.loads(stripped)
+                        except orjson.JSONDecodeError:
+                            pass
+                    # Return as is if not JSON
+                    return {"result": content_text}
                 
                 # Fallback: return the raw result
                 return {"result": str(result)}
                 
             except Exception as e:
-                print(f"Error executing tool {tool_name}: {str(e)}")
+                log.exception("Error executing tool %s: %s", tool_name, e)
                 return {
                     "error": str(e), 
                     "tool": tool_name,
@@ -152,16 +162,13 @@ class MCPToolManager:
     
     def get_tools_for_agent(self, server_names: Optional[List[str]] = None) -> List[Callable]:
         """Get tool functions for OpenAI Agents SDK"""
-        tools = []
-        
-        for tool_key, tool_func in self.tool_functions.items():
-            server_name = tool_key.split("_")[0]
-            
-            if server_names and server_name not in server_names:
-                continue
-            
-            tools.append(tool_func)
+        if not server_names:
+            return list(self.tool_functions.values())
         
+        # Per-server lists are precomputed in initialize_mcp_servers
+        tools = []
+        for server_name in server_names:
+            tools.extend(self._tools_by_server.get(server_name, ()))
         return tools
     
     def get_connection_status(self) -> Dict[str, Any]:
@@ -180,6 +187,6 @@ class MCPToolManager:
                     await contexts['session_ctx'].__aexit__(None, None, None)
                 if 'stdio' in contexts:
                     await contexts['stdio'].__aexit__(None, None, None)
-                print(f"✓ Closed MCP server: {name}")
+                log.info("✓ Closed MCP server: %s", name)
             except Exception as e:
-                print(f"✗ Error closing {name}: {e}")
+                log.error("✗ Error closing %s: %s", name, e)
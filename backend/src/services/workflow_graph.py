@@ -2,16 +2,133 @@ from services.autogen_manager import get_agents_manager, AgentsManager
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import InMemorySaver
 from config.pydantic_models import State
-from typing import Dict, Any
+from langchain_core.runnables import RunnableConfig
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
+import hashlib
+import logging
+import orjson
+import time
+import uuid
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, TypedDict
+
+log = logging.getLogger(__name__)
+
+
+# Workflow type -> graph node
+_WORKFLOW_ROUTES: Mapping[str, str] = MappingProxyType({
+    "standup": "standup",
+    "qa": "qa",
+    "onboarding": "onboarding",
+    "meeting": "qa",  # meetings handled by QA
+    "transcription": "qa"  # transcriptions handled by QA
+})
+
+class WorkflowResult(TypedDict, total=False):
+    """What execute_workflow returns; error results carry "error" instead of the run details"""
+    status: str
+    workflow_type: str
+    user_id: Optional[str]
+    summary: str
+    full_result: Any
+    agent_used: Optional[str]
+    conversation_id: Optional[str]
+    mcp_status: Dict[str, Any]
+    error: str
+
+
+def _specialist_handler(workflow_type: str, default_summary: str):
+    """Node handler that runs one specialist via the AgentsManager in the run config.
+
+    Returns only the metadata delta; State.metadata's reducer merges it.
+    """
+    async def handler(state: State, config: RunnableConfig) -> Dict[str, Any]:
+        agents_manager = config["configurable"]["agents_manager"]
+        try:
+            result = await agents_manager.process_workflow(workflow_type, state.metadata)
+        except Exception as e:
+            return {"metadata": {
+                "workflow_result": {"status": "error", "error": str(e)},
+                "final_summary": f"Error: {str(e)}"
+            }}
+        if result.get("status") == "error":
+            return {"metadata": {
+                "workflow_result": result,
+                "final_summary": f"Error: {result.get('error', 'Workflow failed')}"
+            }}
+        return {"metadata": {
+            "workflow_result": result,
+            "final_summary": result.get("summary", default_summary),
+            "conversation_id": result.get("conversation_id"),
+            "mcp_status": result.get("mcp_status", {})
+        }}
+    return handler
+
+
+def _content_key(*parts: Any) -> str:
+    """Stable hash of JSON-like values; dict key order doesn't matter"""
+    payload = orjson.dumps(
+        parts,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# A retried or double-submitted request joins the run already in flight, and a
+# successful result is reused briefly so a late retry doesn't re-run the agents.
+RECENT_RESULT_TTL = 30.0
+RECENT_RESULT_SIZE = 1024
+
+
+def _route_to_specialist(state: State) -> str:
+    """Direct routing to specialist"""
+    return _WORKFLOW_ROUTES.get(state.workflow_type, "qa")
+
+
+@lru_cache(maxsize=2)
+def _build_graph(enable_checkpoints: bool = False):
+    """Build and compile the graph once per process; the topology never changes"""
+    graph_builder = StateGraph(State)
+    
+    graph_builder.add_node('standup', _specialist_handler("standup", "Standup completed"))
+    graph_builder.add_node('qa', _specialist_handler("qa", "Query processed"))
+    graph_builder.add_node('onboarding', _specialist_handler("onboarding", "Onboarding started"))
+    
+    # Direct routing from START
+    graph_builder.add_conditional_edges(
+        START,
+        _route_to_specialist,
+        {
+            "standup": "standup",
+            "qa": "qa",
+            "onboarding": "onboarding"
+        }
+    )
+    
+    # All nodes go to END
+    graph_builder.add_edge("standup", END)
+    graph_builder.add_edge("qa", END)
+    graph_builder.add_edge("onboarding", END)
+    
+    # Nothing resumes or replays a run, so snapshotting state after every
+    # superstep is pure overhead unless explicitly asked for
+    checkpointer = InMemorySaver() if enable_checkpoints else None
+    return graph_builder.compile(checkpointer=checkpointer)
 
 
 class WorkflowGraph:
     """Direct specialist routing - NO coordinator node"""
     
-    def __init__(self, agents_manager: AgentsManager = None):
+    def __init__(self, agents_manager: AgentsManager = None, enable_checkpoints: bool = False):
         self.agents_manager = agents_manager
+        self.enable_checkpoints = enable_checkpoints
         self.graph = None
         self._initialized = False
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._recent: "OrderedDict[str, tuple[float, WorkflowResult]]" = OrderedDict()
     
     async def initialize(self):
         if self._initialized:
@@ -24,119 +141,61 @@ class WorkflowGraph:
         self._initialized = True
     
     def build_graph(self):
-        """Build graph with direct specialist routing"""
-        graph_builder = StateGraph(State)
-        
-        # ====================================================================
-        # SINGLE NODE HANDLERS - Direct specialist processing
-        # ====================================================================
-        
-        async def standup_handler(state: State) -> State:
-            """Direct standup specialist call"""
-            try:
-                result = await self.agents_manager.process_workflow("standup", state.metadata)
-                state.metadata.update({
-                    "workflow_result": result,
-                    "final_summary": result.get("summary", "Standup completed"),
-                    "conversation_id": result.get("conversation_id"),
-                    "mcp_status": result.get("mcp_status", {})
-                })
-            except Exception as e:
-                state.metadata.update({
-                    "workflow_result": {"status": "error", "error": str(e)},
-                    "final_summary": f"Error: {str(e)}"
-                })
-            return state
-        
-        async def qa_handler(state: State) -> State:
-            """Direct QA specialist call"""
-            try:
-                result = await self.agents_manager.process_workflow("qa", state.metadata)
-                state.metadata.update({
-                    "workflow_result": result,
-                    "final_summary": result.get("summary", "Query processed"),
-                    "conversation_id": result.get("conversation_id"),
-                    "mcp_status": result.get("mcp_status", {})
-                })
-            except Exception as e:
-                state.metadata.update({
-                    "workflow_result": {"status": "error", "error": str(e)},
-                    "final_summary": f"Error: {str(e)}"
-                })
-            return state
-        
-        async def onboarding_handler(state: State) -> State:
-            """Direct onboarding specialist call"""
-            try:
-                result = await self.agents_manager.process_workflow("onboarding", state.metadata)
-                state.metadata.update({
-                    "workflow_result": result,
-                    "final_summary": result.get("summary", "Onboarding started"),
-                    "conversation_id": result.get("conversation_id"),
-                    "mcp_status": result.get("mcp_status", {})
-                })
-            except Exception as e:
-                state.metadata.update({
-                    "workflow_result": {"status": "error", "error": str(e)},
-                    "final_summary": f"Error: {str(e)}"
-                })
-            return state
-        
-        # ====================================================================
-        # ROUTER - Direct to specialist based on workflow type
-        # ====================================================================
-        
-        def route_to_specialist(state: State) -> str:
-            """Direct routing to specialist"""
-            routes = {
-                "standup": "standup",
-                "qa": "qa",
-                "onboarding": "onboarding",
-                "meeting": "qa",  # meetings handled by QA
-                "transcription": "qa"  # transcriptions handled by QA
-            }
-            return routes.get(state.workflow_type, "qa")
-        
-        # ====================================================================
-        # BUILD GRAPH - Simple direct routing
-        # ====================================================================
-        
-        graph_builder.add_node('standup', standup_handler)
-        graph_builder.add_node('qa', qa_handler)
-        graph_builder.add_node('onboarding', onboarding_handler)
-        
-        # Direct routing from START
-        graph_builder.add_conditional_edges(
-            START,
-            route_to_specialist,
-            {
-                "standup": "standup",
-                "qa": "qa",
-                "onboarding": "onboarding"
-            }
-        )
-        
-        # All nodes go to END
-        graph_builder.add_edge("standup", END)
-        graph_builder.add_edge("qa", END)
-        graph_builder.add_edge("onboarding", END)
-        
-        checkpointer = InMemorySaver()
-        return graph_builder.compile(checkpointer=checkpointer)
+        """Return the shared compiled graph; agents_manager is passed per run via config"""
+        return _build_graph(self.enable_checkpoints)
     
     async def execute_workflow(
         self,
         workflow_type: str,
         data: Dict[str, Any],
         user_id: str = None
-    ) -> Dict[str, Any]:
-        """Execute workflow"""
+    ) -> WorkflowResult:
+        """Execute workflow, sharing the run with identical concurrent or recent requests"""
+        key = _content_key(workflow_type, user_id, data)
+        hit = self._recent.get(key)
+        if hit is not None and time.monotonic() - hit[0] < RECENT_RESULT_TTL:
+            self._recent.move_to_end(key)
+            log.debug("Reusing recent %s result for %s", workflow_type, user_id)
+            return hit[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_workflow(workflow_type, data, user_id))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_run(key, t))
+        else:
+            log.debug("Joining in-flight %s workflow for %s", workflow_type, user_id)
+        # shield: cancelling one waiter must not cancel the run for the others
+        return await asyncio.shield(task)
+    
+    def _finish_run(self, key: str, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if result.get("status") == "success":
+            self._recent[key] = (time.monotonic(), result)
+            self._recent.move_to_end(key)
+            while len(self._recent) > RECENT_RESULT_SIZE:
+                self._recent.popitem(last=False)
+    
+    async def cancel_inflight(self):
+        """Cancel and await shared runs; waiters are shielded, so shutdown must do this"""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _run_workflow(
+        self,
+        workflow_type: str,
+        data: Dict[str, Any],
+        user_id: str = None
+    ) -> WorkflowResult:
         if not self._initialized:
             await self.initialize()
         
-        print(f"\n{'='*60}")
-        print(f"Workflow: {workflow_type} | User: {user_id}")
-        print(f"{'='*60}")
+        log.debug("Workflow: %s | User: %s", workflow_type, user_id)
         
         state = State(
             messages=[],
@@ -146,19 +205,25 @@ class WorkflowGraph:
         )
         
         try:
-            result = await self.graph.ainvoke(state, config={"configurable": {"thread_id": "1"}})
+            configurable = {"agents_manager": self.agents_manager}
+            if self.enable_checkpoints:
+                # nothing resumes a thread, so each run gets its own checkpoint stream
+                configurable["thread_id"] = uuid.uuid4().hex
+            result = await self.graph.ainvoke(state, config={"configurable": configurable})
             
-            metadata = result.get("metadata", {})
-            workflow_result = metadata.get("workflow_result", {})
+            # every specialist node sets these keys (or raises)
+            metadata = result["metadata"]
+            workflow_result = metadata["workflow_result"]
+            summary = metadata.get("final_summary", "Completed")
             
-            print(f"Summary: {metadata.get('final_summary', 'N/A')}")
-            print(f"{'='*60}\n")
+            log.debug("Summary: %s", summary)
             
             return {
-                "status": "success",
+                # a failed specialist run is an error, not a "success" with error text
+                "status": workflow_result.get("status", "success"),
                 "workflow_type": workflow_type,
                 "user_id": user_id,
-                "summary": metadata.get("final_summary", "Completed"),
+                "summary": summary,
                 "full_result": workflow_result.get("result"),
                 "agent_used": workflow_result.get("agent_used"),
                 "conversation_id": metadata.get("conversation_id"),
@@ -166,8 +231,7 @@ class WorkflowGraph:
             }
             
         except Exception as e:
-            print(f"Error: {str(e)}")
-            print(f"{'='*60}\n")
+            log.error("Workflow %s failed: %s", workflow_type, e)
             
             return {
                 "status": "error",